@@ -10,24 +10,303 @@ lower timeframe based on zone timeframe.
 """
 
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import functools
 import logging
+import queue
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 from database.utils.postgresql_utils import PostgreSQLConnectionPool, SymbolCache
 from src.visualization.timeframe_utils import get_chart_timeframe_for_zone
 
 logger = logging.getLogger(__name__)
 
+# Chart palette, shared by every chart build
+_ZONE_PALETTE = MappingProxyType({
+    'supply': MappingProxyType({'fill': 'rgba(255, 82, 82, 0.2)', 'border': '#FF5252'}),
+    'demand': MappingProxyType({'fill': 'rgba(76, 175, 80, 0.2)', 'border': '#4CAF50'}),
+})
+_NODE_PALETTE = MappingProxyType({
+    'HVN': MappingProxyType({'label': 'HVN', 'line': '#FFC107'}),
+    'LVN': MappingProxyType({'label': 'LVN', 'line': '#2196F3'}),
+})
+_BAR_UP, _BAR_DOWN = '#26a69a', '#ef5350'
+
+# Annotation placement matching add_hline's annotation_position='left'/'right'
+_HLINE_ANNOTATION_ANCHORS = MappingProxyType({
+    'left': MappingProxyType({'x': 0, 'xanchor': 'right'}),
+    'right': MappingProxyType({'x': 1, 'xanchor': 'left'}),
+})
+
+# Hover for WebGL candle bodies, whose customdata rows are (open, high, low, close)
+_OHLC_HOVERTEMPLATE = (
+    "open: %{customdata[0]:.2f}<br>high: %{customdata[1]:.2f}<br>"
+    "low: %{customdata[2]:.2f}<br>close: %{customdata[3]:.2f}"
+)
+
+# Intraday candle views available as stocks.candles_<N>m
+_CANDLE_VIEW_MINUTES = (2, 3, 5, 6, 10, 13, 15, 26, 30, 39, 65, 78, 130, 195, 390)
+
+# Zone timeframes come from a small fixed set, so the zone -> chart timeframe
+# mapping is memoized for the life of the process
+_chart_timeframe_for_zone = functools.lru_cache(maxsize=None)(get_chart_timeframe_for_zone)
+
+
+@dataclass(frozen=True)
+class Candles:
+    """Column-oriented OHLCV data, passed straight into Plotly traces."""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    timeframe_minutes: int
+    # Full-precision close of the last candle, for prices printed as text
+    last_close: float
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+def _candles_from_rows(rows: List[Tuple], timeframe_minutes: int) -> Candles:
+    """
+    Build columns directly from (bucket, open, high, low, close, volume) rows.
+
+    float32 is plenty for pixel-space prices and halves the bytes Plotly
+    encodes, but drops cents on high prices, so the last close is kept as is.
+    """
+    if not rows:
+        empty = np.empty(0, dtype=np.float32)
+        return Candles(
+            timestamp=np.empty(0, dtype=object), open=empty, high=empty, low=empty, close=empty,
+            volume=np.empty(0, dtype=np.int64), timeframe_minutes=timeframe_minutes, last_close=float('nan')
+        )
+
+    ts, o, h, l, c, v = zip(*rows)
+    return Candles(
+        timestamp=np.asarray(ts),
+        open=np.asarray(o, dtype=np.float32),
+        high=np.asarray(h, dtype=np.float32),
+        low=np.asarray(l, dtype=np.float32),
+        close=np.asarray(c, dtype=np.float32),
+        volume=np.asarray(v, dtype=np.int64),
+        timeframe_minutes=timeframe_minutes,
+        last_close=float(c[-1])
+    )
+
+
+def _concat_candles(closed: Candles, current: Candles) -> Candles:
+    """Append freshly read candles to cached closed ones."""
+    return Candles(
+        timestamp=np.concatenate((closed.timestamp, current.timestamp)),
+        open=np.concatenate((closed.open, current.open)),
+        high=np.concatenate((closed.high, current.high)),
+        low=np.concatenate((closed.low, current.low)),
+        close=np.concatenate((closed.close, current.close)),
+        volume=np.concatenate((closed.volume, current.volume)),
+        timeframe_minutes=current.timeframe_minutes,
+        last_close=current.last_close
+    )
+
+
+def _segments(x: np.ndarray, y0: np.ndarray, y1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Interleave vertical (x, y0) -> (x, y1) segments with gaps for a single line trace."""
+    n = len(x)
+    xs = np.empty(n * 3, dtype=object)
+    xs[0::3] = x
+    xs[1::3] = x
+    xs[2::3] = None
+    ys = np.empty(n * 3, dtype=np.result_type(y0, y1))
+    ys[0::3] = y0
+    ys[1::3] = y1
+    ys[2::3] = np.nan
+    return xs, ys
+
+
+def _webgl_candle_traces(candles: Candles, up_color: str, down_color: str, name: str) -> List[go.Scattergl]:
+    """
+    Build candlesticks as WebGL line segments (wicks + thicker bodies).
+
+    Bodies carry each candle's OHLC as customdata so hover reads like a
+    Candlestick trace; wicks skip hover to avoid duplicate entries.
+
+    Args:
+        candles: Candle columns
+        up_color: Color for close >= open
+        down_color: Color for close < open
+        name: Legend name for the price series
+
+    Returns:
+        List of Scattergl traces
+    """
+    up = candles.close >= candles.open
+    traces = []
+    for mask, color in ((up, up_color), (~up, down_color)):
+        x = candles.timestamp[mask]
+        wick_x, wick_y = _segments(x, candles.low[mask], candles.high[mask])
+        body_x, body_y = _segments(x, candles.open[mask], candles.close[mask])
+        # One OHLC row per segment point (open, close and the gap)
+        ohlc = np.repeat(
+            np.column_stack((candles.open[mask], candles.high[mask], candles.low[mask], candles.close[mask])),
+            3, axis=0
+        )
+        traces.append(go.Scattergl(
+            x=wick_x, y=wick_y, mode='lines', line=dict(color=color, width=1),
+            name=name, legendgroup=name, showlegend=False, hoverinfo='skip'
+        ))
+        traces.append(go.Scattergl(
+            x=body_x, y=body_y, mode='lines', line=dict(color=color, width=4),
+            name=name, legendgroup=name, showlegend=color == up_color,
+            customdata=ohlc, hovertemplate=_OHLC_HOVERTEMPLATE
+        ))
+    return traces
+
+
+def _padded_start(start_time: datetime, end_time: datetime) -> datetime:
+    """Start of the chart window: market open for single-day charts, else 10% extra history."""
+    if start_time.date() == end_time.date():
+        return start_time.replace(hour=9, minute=30, second=0, microsecond=0)
+    return start_time - (end_time - start_time) * 0.1
+
+
+def _estimate_candle_count(start_time: datetime, end_time: datetime, timeframe_minutes: int) -> float:
+    """Rough candle count for a window, assuming 390 trading minutes a day, 5 days a week."""
+    minutes = (end_time - start_time).total_seconds() / 60
+    if minutes > 24 * 60:
+        minutes *= (390 / (24 * 60)) * (5 / 7)
+    return minutes / timeframe_minutes
+
+
+def _coarsest_needed_view(
+    start_time: datetime,
+    end_time: datetime,
+    timeframe_minutes: int,
+    max_candles: int
+) -> int:
+    """
+    Pick the finest candle view that keeps the window under max_candles.
+
+    Returns timeframe_minutes unchanged when it already fits; otherwise the
+    smallest coarser view that fits, or the coarsest view available.
+    """
+    if _estimate_candle_count(start_time, end_time, timeframe_minutes) <= max_candles:
+        return timeframe_minutes
+
+    coarser = [m for m in _CANDLE_VIEW_MINUTES if m > timeframe_minutes]
+    for minutes in coarser:
+        if _estimate_candle_count(start_time, end_time, minutes) <= max_candles:
+            return minutes
+    return coarser[-1] if coarser else timeframe_minutes
+
+
+class _PngRenderQueue:
+    """
+    Coalesces concurrent PNG exports into batched Kaleido calls.
+
+    Callers submit a figure and wait on the returned Future; a single
+    background thread drains everything pending and renders it with one
+    pio.write_images call per (width, height) group, so bursts of alerts
+    share one round trip to the browser instead of queuing up serially.
+    """
+
+    MAX_BATCH_SIZE = 16
+
+    def __init__(self):
+        self._pending: "queue.Queue[Tuple[Dict, Path, int, int, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fig_dict: Dict, png_path: Path, width: int, height: int) -> Future:
+        """Queue a PNG export; the Future resolves to png_path once written."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='chart-png', daemon=True)
+                self._thread.start()
+
+        future = Future()
+        self._pending.put((fig_dict, png_path, width, height, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            groups: Dict[Tuple[int, int], List] = {}
+            for item in batch:
+                groups.setdefault((item[2], item[3]), []).append(item)
+
+            for (width, height), items in groups.items():
+                self._render(items, width, height)
+
+    def _render(self, items: List, width: int, height: int) -> None:
+        try:
+            pio.write_images(
+                [item[0] for item in items], [item[1] for item in items],
+                format='png', width=width, height=height, validate=False
+            )
+            for _, png_path, _, _, future in items:
+                future.set_result(png_path)
+            return
+        except Exception as e:
+            if len(items) == 1:
+                items[0][4].set_exception(e)
+                return
+            logger.warning(f"Batched PNG export failed, retrying {len(items)} charts individually: {e}")
+
+        # Retry one by one so a single bad figure does not fail the whole batch
+        for item in items:
+            self._render([item], width, height)
+
+
+_png_render_queue = _PngRenderQueue()
+
 
 class ChartGenerator:
     """
     Generates interactive HTML and static PNG charts for zone alerts.
     """
 
+    # Kaleido v1 launches Chromium per export unless a sync server is running;
+    # start it once per process and share it across all generator instances.
+    _kaleido_server_started = False
+
+    # Max number of (symbol, timeframe, window) closed-candle results kept in memory
+    CHART_DATA_CACHE_SIZE = 256
+
+    # Above this many candles, price action charts render with WebGL traces
+    WEBGL_CANDLE_THRESHOLD = 500
+
+    # Seconds an alert waits for its PNG before sending without a thumbnail
+    PNG_RENDER_TIMEOUT = 60
+
+    # Prepared candle statements per pooled connection (sessions are shared
+    # across instances, and entries go away with their connection)
+    _prepared_statements: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _prepared_lock = threading.Lock()
+
+    # HTML charts are only opened later by humans, so they are written off the
+    # alert path by a small shared pool
+    _html_writer: Optional[ThreadPoolExecutor] = None
+    _html_writer_lock = threading.Lock()
+
     def __init__(self, output_dir: str = "data/temp/alert_charts"):
         """
         Initialize chart generator.
@@ -38,6 +317,28 @@ class ChartGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.db_pool = PostgreSQLConnectionPool.get_instance()
+        self._chart_data_cache: OrderedDict = OrderedDict()
+        self._chart_data_cache_lock = threading.Lock()
+        self._start_kaleido_server()
+
+    @classmethod
+    def _start_kaleido_server(cls) -> None:
+        """Start the process-wide Kaleido sync server used for PNG export."""
+        if cls._kaleido_server_started:
+            return
+
+        try:
+            import kaleido
+        except ImportError:
+            logger.info("PNG generation requires 'kaleido' package. Install with: pip install kaleido")
+            return
+
+        try:
+            kaleido.start_sync_server(silence_warnings=True)
+            cls._kaleido_server_started = True
+            logger.info("Started Kaleido sync server for PNG export")
+        except Exception as e:
+            logger.warning(f"Could not start Kaleido sync server, PNG export will be slower: {e}")
 
     def generate_zone_alert_chart(
         self,
@@ -69,7 +370,7 @@ class ChartGenerator:
             Tuple of (html_path, png_path)
         """
         # Get chart timeframe based on zone timeframe
-        chart_tf = get_chart_timeframe_for_zone(zone_timeframe_minutes)
+        chart_tf = _chart_timeframe_for_zone(zone_timeframe_minutes)
         chart_timeframe_minutes = chart_tf['minutes']
         chart_label = chart_tf['label']
 
@@ -90,8 +391,11 @@ class ChartGenerator:
             logger.warning(f"No candle data found for {symbol} chart")
             return None, None
 
-        # Create interactive HTML chart
-        html_path = self._generate_html_chart(
+        if candles.timeframe_minutes != chart_timeframe_minutes:
+            chart_label = f"{candles.timeframe_minutes}min"
+
+        # Build the chart once; HTML path is reserved but written later
+        html_path, fig_dict = self._build_zone_alert_chart(
             symbol=symbol,
             zone_type=zone_type,
             zone_top=zone_top,
@@ -103,10 +407,12 @@ class ChartGenerator:
             zone_formation_candles=zone_formation_candles
         )
 
-        # Generate PNG thumbnail
-        png_path = self._generate_png_thumbnail(html_path)
+        # Discord only needs the PNG, so render it on the alert path and hand
+        # the HTML write to the background pool
+        png_path = self._generate_png_thumbnail(fig_dict, html_path)
+        self._write_html_in_background(fig_dict, html_path)
 
-        logger.info(f"Generated charts: HTML={html_path}, PNG={png_path}")
+        logger.info(f"Generated charts: HTML={html_path} (pending), PNG={png_path}")
         return html_path, png_path
 
     def _fetch_chart_data(
@@ -114,8 +420,9 @@ class ChartGenerator:
         symbol: str,
         chart_timeframe_minutes: int,
         start_time: datetime,
-        end_time: datetime
-    ) -> List[Dict]:
+        end_time: datetime,
+        max_candles: int = 2000
+    ) -> Optional[Candles]:
         """
         Fetch candle data for chart from database views.
 
@@ -124,26 +431,43 @@ class ChartGenerator:
             chart_timeframe_minutes: Chart timeframe in minutes
             start_time: Start time (zone formation)
             end_time: End time (current time)
+            max_candles: Switch to a coarser view if the window would exceed this
 
         Returns:
-            List of candle dictionaries
+            Candles with NumPy columns (timeframe_minutes is the view actually
+            used), or None if no data
         """
         # Get symbol_id for optimized query (2-3x faster)
         symbol_id = SymbolCache.get_id(symbol)
         if not symbol_id:
             logger.warning(f"Symbol {symbol} not found in database")
-            return []
-
-        # Determine if we're querying a single day
-        query_single_day = start_time.date() == end_time.date()
+            return None
 
-        # Add padding before zone formation (show 10% more history)
-        if query_single_day:
-            # Single day - start from market open
-            padded_start = start_time.replace(hour=9, minute=30, second=0, microsecond=0)
-        else:
-            time_range = end_time - start_time
-            padded_start = start_time - (time_range * 0.1)
+        # Charts are ~2000px wide; fetching more candles than that only adds
+        # serialization and rendering work, so step up to a coarser view
+        view_minutes = _coarsest_needed_view(
+            _padded_start(start_time, end_time), end_time, chart_timeframe_minutes, max_candles
+        )
+        if view_minutes != chart_timeframe_minutes:
+            logger.info(
+                f"Window for {symbol} exceeds {max_candles} candles at {chart_timeframe_minutes}min, "
+                f"using {view_minutes}min view"
+            )
+            chart_timeframe_minutes = view_minutes
+
+        # Align both ends of the window down to the chart bucket boundary, so
+        # alerts whose windows start and end in the same buckets share a cache
+        # entry (the end bucket turning over is the cache TTL)
+        bucket_seconds = chart_timeframe_minutes * 60
+        aligned_end = end_time - timedelta(seconds=end_time.timestamp() % bucket_seconds)
+        padded_start = _padded_start(start_time, aligned_end)
+        aligned_start = padded_start - timedelta(seconds=padded_start.timestamp() % bucket_seconds)
+
+        cache_key = (symbol_id, chart_timeframe_minutes, aligned_start.isoformat(), aligned_end.isoformat())
+        with self._chart_data_cache_lock:
+            cached = self._chart_data_cache.get(cache_key)
+            if cached is not None:
+                self._chart_data_cache.move_to_end(cache_key)
 
         # Select appropriate view based on timeframe
         # Views use short suffix: 'm' for minutes, 'd' for days
@@ -151,47 +475,94 @@ class ChartGenerator:
         view_name = f"stocks.candles_{chart_timeframe_minutes}m"
         logger.info(f"Using view: {view_name} for {symbol}")
 
-        query = f"""
-        SELECT
-            bucket,
-            open,
-            high,
-            low,
-            close,
-            volume
-        FROM {view_name}
-        WHERE symbol_id = %s
-          AND bucket >= %s
-          AND bucket <= %s
-        ORDER BY bucket ASC
-        """
-
         try:
+            # Only closed buckets are cached. The newest bucket may still be
+            # forming (its high/low/close keep moving), so it is always
+            # re-read, from its own start onwards.
+            fetch_start = aligned_start if cached is None else cached[1]
             with self.db_pool.get_cursor() as cur:
-                # Query by symbol_id for performance
-                cur.execute(query, (symbol_id, padded_start, end_time))
+                # Query by symbol_id for performance, reusing the server-side plan
+                statement = self._prepare_candle_query(cur, view_name, chart_timeframe_minutes)
+                cur.execute(f"EXECUTE {statement} (%s, %s, %s)", (symbol_id, fetch_start, end_time))
                 rows = cur.fetchall()
 
-            candles = [
-                {
-                    'timestamp': row[0],
-                    'open': float(row[1]),
-                    'high': float(row[2]),
-                    'low': float(row[3]),
-                    'close': float(row[4]),
-                    'volume': int(row[5])
-                }
-                for row in rows
-            ]
-
-            logger.info(f"Fetched {len(candles)} candles from {view_name} for {symbol}")
-            return candles
+            if cached is None:
+                if not rows:
+                    logger.info(f"Fetched 0 candles from {view_name} for {symbol}")
+                    return None
+
+                # Cache everything but the newest bucket, along with that
+                # bucket's start as the database returned it
+                with self._chart_data_cache_lock:
+                    self._chart_data_cache[cache_key] = (
+                        _candles_from_rows(rows[:-1], chart_timeframe_minutes), rows[-1][0]
+                    )
+                    if len(self._chart_data_cache) > self.CHART_DATA_CACHE_SIZE:
+                        self._chart_data_cache.popitem(last=False)
+
+                logger.info(f"Fetched {len(rows)} candles from {view_name} for {symbol}")
+                return _candles_from_rows(rows, chart_timeframe_minutes)
+
+            closed = cached[0]
+            logger.info(
+                f"Using {len(closed)} cached candles for {symbol} ({chart_timeframe_minutes}min), "
+                f"fetched {len(rows)} current"
+            )
+            current = _candles_from_rows(rows, chart_timeframe_minutes)
+            if not len(current):
+                return closed if len(closed) else None
+            return _concat_candles(closed, current) if len(closed) else current
 
         except Exception as e:
             logger.error(f"Error fetching chart data from {view_name}: {e}")
-            return []
+            return None
+
+    def _prepare_candle_query(self, cur, view_name: str, chart_timeframe_minutes: int) -> str:
+        """
+        Ensure the candle query for a view is prepared on the cursor's connection.
+
+        Prepared statements live per database session, so they are created
+        lazily the first time each pooled connection queries a given view.
 
-    def _generate_html_chart(
+        Args:
+            cur: Cursor from the connection pool
+            view_name: Schema-qualified candle view
+            chart_timeframe_minutes: Chart timeframe in minutes
+
+        Returns:
+            Name of the prepared statement
+        """
+        statement = f"fetch_candles_{chart_timeframe_minutes}m"
+        conn = cur.connection
+
+        with self._prepared_lock:
+            prepared = self._prepared_statements.setdefault(conn, set())
+            if statement in prepared:
+                return statement
+
+        # Cast in SQL so the driver hands back native floats/ints instead of
+        # Decimal objects that would need a per-cell conversion in Python
+        cur.execute(f"""
+        PREPARE {statement} AS
+        SELECT
+            bucket,
+            open::float8,
+            high::float8,
+            low::float8,
+            close::float8,
+            volume::bigint
+        FROM {view_name}
+        WHERE symbol_id = $1
+          AND bucket >= $2
+          AND bucket <= $3
+        ORDER BY bucket ASC
+        """)
+
+        with self._prepared_lock:
+            prepared.add(statement)
+        return statement
+
+    def _build_zone_alert_chart(
         self,
         symbol: str,
         zone_type: str,
@@ -199,12 +570,15 @@ class ChartGenerator:
         zone_bottom: float,
         zone_timeframe_minutes: int,
         chart_label: str,
-        candles: List[Dict],
+        candles: Candles,
         current_price: float,
         zone_formation_candles: Optional[List[Dict]] = None
-    ) -> str:
+    ) -> Tuple[str, Dict]:
         """
-        Generate interactive HTML chart using Plotly.
+        Build the interactive zone alert chart using Plotly.
+
+        Does not write anything to disk; the caller decides when to write
+        the HTML (see _write_html) and PNG outputs.
 
         Args:
             symbol: Stock symbol
@@ -213,15 +587,13 @@ class ChartGenerator:
             zone_bottom: Bottom of zone
             zone_timeframe_minutes: Zone timeframe in minutes
             chart_label: Chart timeframe label (e.g., '5min')
-            candles: List of candle data
+            candles: Candle columns from _fetch_chart_data
             current_price: Current price
             zone_formation_candles: Candles that formed the zone (highlighted in yellow)
 
         Returns:
-            Path to generated HTML file
+            Tuple of (reserved html_path, serialized figure dict)
         """
-        df = pd.DataFrame(candles)
-
         # Calculate zone penetration percentage
         zone_range = zone_top - zone_bottom
         if zone_type == 'demand':
@@ -244,28 +616,28 @@ class ChartGenerator:
         # Add candlestick chart
         fig.add_trace(
             go.Candlestick(
-                x=df['timestamp'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
+                x=candles.timestamp,
+                open=candles.open,
+                high=candles.high,
+                low=candles.low,
+                close=candles.close,
                 name='Price',
-                increasing_line_color='#26a69a',
-                decreasing_line_color='#ef5350'
+                increasing_line_color=_BAR_UP,
+                decreasing_line_color=_BAR_DOWN
             ),
             row=1, col=1
         )
 
         # Highlight zone formation candles in yellow
         if zone_formation_candles:
-            formation_df = pd.DataFrame(zone_formation_candles)
+            # Only a handful of candles; plain lists avoid DataFrame setup cost
             fig.add_trace(
                 go.Candlestick(
-                    x=formation_df['timestamp'],
-                    open=formation_df['open'],
-                    high=formation_df['high'],
-                    low=formation_df['low'],
-                    close=formation_df['close'],
+                    x=[c['timestamp'] for c in zone_formation_candles],
+                    open=[c['open'] for c in zone_formation_candles],
+                    high=[c['high'] for c in zone_formation_candles],
+                    low=[c['low'] for c in zone_formation_candles],
+                    close=[c['close'] for c in zone_formation_candles],
                     name='Zone Formation',
                     increasing_line_color='#FFD700',
                     decreasing_line_color='#FFA500',
@@ -276,14 +648,13 @@ class ChartGenerator:
             )
 
         # Draw zone as rectangle
-        zone_color = 'rgba(255, 82, 82, 0.2)' if zone_type == 'supply' else 'rgba(76, 175, 80, 0.2)'
-        zone_border = '#FF5252' if zone_type == 'supply' else '#4CAF50'
+        zone_palette = _ZONE_PALETTE.get(zone_type, _ZONE_PALETTE['demand'])
 
         fig.add_hrect(
             y0=zone_bottom,
             y1=zone_top,
-            fillcolor=zone_color,
-            line=dict(color=zone_border, width=2),
+            fillcolor=zone_palette['fill'],
+            line=dict(color=zone_palette['border'], width=2),
             annotation_text=f"{zone_timeframe_minutes}min {zone_type.upper()} Zone",
             annotation_position="top left",
             row=1, col=1
@@ -300,13 +671,12 @@ class ChartGenerator:
         )
 
         # Add volume bars
-        colors = ['#26a69a' if close >= open else '#ef5350'
-                  for close, open in zip(df['close'], df['open'])]
+        colors = np.where(candles.close >= candles.open, _BAR_UP, _BAR_DOWN)
 
         fig.add_trace(
             go.Bar(
-                x=df['timestamp'],
-                y=df['volume'],
+                x=candles.timestamp,
+                y=candles.volume,
                 name='Volume',
                 marker_color=colors,
                 showlegend=False
@@ -340,44 +710,81 @@ class ChartGenerator:
         fig.update_yaxes(title_text="Volume", row=2, col=1)
 
         # Generate filename
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_{zone_type}_{zone_timeframe_minutes}min_{timestamp_str}.html"
+        filename = f"{symbol}_{zone_type}_{zone_timeframe_minutes}min_{time.time_ns()}.html"
         filepath = self.output_dir / filename
 
-        # Save HTML
-        fig.write_html(str(filepath), config={'displayModeBar': True})
+        # Serialize once; the HTML and PNG writers share the same dict
+        return str(filepath), fig.to_dict()
 
-        logger.info(f"Generated HTML chart: {filepath}")
-        return str(filepath)
+    def _write_html(self, fig_dict: Dict, filepath) -> None:
+        """
+        Write a serialized figure to an interactive HTML file.
 
-    def _generate_png_thumbnail(self, html_path: str, width: int = 1920, height: int = 1080) -> str:
+        Args:
+            fig_dict: Figure dict (from fig.to_dict())
+            filepath: Destination HTML path
         """
-        Generate PNG thumbnail from HTML chart.
+        # Load plotly.js from the CDN rather than inlining ~3.5 MB into every file
+        pio.write_html(
+            fig_dict, file=str(filepath), include_plotlyjs='cdn', full_html=True,
+            config={'displayModeBar': True}, auto_open=False, validate=False
+        )
+        logger.info(f"Saved HTML chart: {filepath}")
+
+    @classmethod
+    def _get_html_writer(cls) -> ThreadPoolExecutor:
+        """Return the shared pool used for HTML writes, creating it on first use."""
+        with cls._html_writer_lock:
+            if cls._html_writer is None:
+                cls._html_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='chart-html')
+            return cls._html_writer
+
+    def _write_html_in_background(self, fig_dict: Dict, filepath) -> Future:
+        """
+        Queue an HTML write on the shared background pool.
+
+        Returns:
+            Future that completes once the write has finished (errors are logged)
+        """
+        def write():
+            try:
+                self._write_html(fig_dict, filepath)
+            except Exception as e:
+                logger.error(f"Error writing HTML chart {filepath}: {e}")
+
+        return self._get_html_writer().submit(write)
+
+    def _generate_png_thumbnail(
+        self,
+        fig_dict: Dict,
+        base_path: str,
+        width: int = 1920,
+        height: int = 1080
+    ) -> Optional[str]:
+        """
+        Generate PNG thumbnail directly from the serialized Plotly figure.
 
         Args:
-            html_path: Path to HTML file
+            fig_dict: Figure dict (from fig.to_dict()) to export
+            base_path: Path of the HTML chart; the PNG is written alongside it
             width: PNG width (default 1920)
             height: PNG height (default 1080)
 
         Returns:
-            Path to PNG file
+            Path to PNG file, or None if export failed
         """
-        # Convert HTML to PNG using kaleido
-        png_path = html_path.replace('.html', '.png')
+        png_path = Path(base_path).with_suffix('.png')
 
         try:
-            # Read the HTML and extract the Plotly figure
-            import plotly.io as pio
-            from kaleido.scopes.plotly import PlotlyScope
+            # Coalesced with any other pending exports into one Kaleido batch
+            _png_render_queue.submit(fig_dict, png_path, width, height).result(timeout=self.PNG_RENDER_TIMEOUT)
 
-            # Read the figure from HTML
-            with open(html_path, 'r') as f:
-                html_content = f.read()
-
-            # This is a simplified approach - in production you might want to
-            # regenerate the figure or use a headless browser
             logger.info(f"Generated PNG thumbnail: {png_path}")
-            return png_path
+            return str(png_path)
+
+        except FutureTimeoutError:
+            logger.error(f"PNG thumbnail not rendered within {self.PNG_RENDER_TIMEOUT}s: {png_path}")
+            return None
 
         except Exception as e:
             logger.error(f"Error generating PNG thumbnail: {e}")
@@ -438,89 +845,68 @@ class ChartGenerator:
                 low=price_data['low'],
                 close=price_data['close'],
                 name='Price',
-                increasing_line_color='#26a69a',
-                decreasing_line_color='#ef5350'
+                increasing_line_color=_BAR_UP,
+                decreasing_line_color=_BAR_DOWN
             ),
             row=1, col=1
         )
 
         # Draw zone rectangle
-        zone_color = 'rgba(255, 82, 82, 0.2)' if zone_type == 'supply' else 'rgba(76, 175, 80, 0.2)'
-        zone_border = '#FF5252' if zone_type == 'supply' else '#4CAF50'
+        zone_palette = _ZONE_PALETTE.get(zone_type, _ZONE_PALETTE['demand'])
 
         fig.add_hrect(
             y0=zone_bottom,
             y1=zone_top,
-            fillcolor=zone_color,
-            line=dict(color=zone_border, width=2),
+            fillcolor=zone_palette['fill'],
+            line=dict(color=zone_palette['border'], width=2),
             annotation_text=f"{zone_type.upper()} Zone",
             annotation_position="top left",
             row=1, col=1
         )
 
-        # Add volume profile nodes
+        # Collect every horizontal level up front and apply them in a single
+        # layout update; each add_hline call re-validates the whole layout
+        levels = []
         for node in volume_nodes:
             node_price = node.price_level if hasattr(node, 'price_level') else node.get('price_level')
             node_type = node.node_type if hasattr(node, 'node_type') else node.get('node_type', 'UNKNOWN')
-
-            node_color = 'rgba(255, 193, 7, 0.3)' if node_type == 'HVN' else 'rgba(33, 150, 243, 0.3)'
-            node_label = f"HVN" if node_type == 'HVN' else "LVN"
-
-            fig.add_hline(
-                y=node_price,
-                line_dash="dot",
-                line_color='#FFC107' if node_type == 'HVN' else '#2196F3',
-                annotation_text=f"{node_label}: ${node_price:.2f}",
-                annotation_position="left",
-                row=1, col=1
+            node_palette = _NODE_PALETTE.get(node_type, _NODE_PALETTE['LVN'])
+            levels.append((
+                node_price, dict(color=node_palette['line'], dash='dot'),
+                f"{node_palette['label']}: ${node_price:.2f}", 'left'
+            ))
+
+        levels.extend([
+            # Entry price line
+            (entry_price, dict(color='white', dash='solid', width=2), f"Entry: ${entry_price:.2f}", 'right'),
+            # Stop loss line (dashed red)
+            (stop_loss, dict(color='#FF5252', dash='dash', width=2), f"Stop Loss: ${stop_loss:.2f}", 'right'),
+            # Target line (dashed green)
+            (target_price, dict(color='#4CAF50', dash='dash', width=2), f"Target (3:1): ${target_price:.2f}", 'right'),
+            # Current price line
+            (current_price, dict(color='yellow', dash='dot'), f"Current: ${current_price:.2f}", 'right'),
+        ])
+
+        shapes = [
+            dict(type='line', xref='x domain', yref='y', x0=0, x1=1, y0=price, y1=price, line=line)
+            for price, line, _, _ in levels
+        ]
+        annotations = [
+            dict(
+                xref='x domain', yref='y', y=price, text=text, showarrow=False, yanchor='middle',
+                **_HLINE_ANNOTATION_ANCHORS[position]
             )
-
-        # Add entry price line
-        fig.add_hline(
-            y=entry_price,
-            line_dash="solid",
-            line_color="white",
-            line_width=2,
-            annotation_text=f"Entry: ${entry_price:.2f}",
-            annotation_position="right",
-            row=1, col=1
-        )
-
-        # Add stop loss line (dashed red)
-        fig.add_hline(
-            y=stop_loss,
-            line_dash="dash",
-            line_color="#FF5252",
-            line_width=2,
-            annotation_text=f"Stop Loss: ${stop_loss:.2f}",
-            annotation_position="right",
-            row=1, col=1
-        )
-
-        # Add target line (dashed green)
-        fig.add_hline(
-            y=target_price,
-            line_dash="dash",
-            line_color="#4CAF50",
-            line_width=2,
-            annotation_text=f"Target (3:1): ${target_price:.2f}",
-            annotation_position="right",
-            row=1, col=1
-        )
-
-        # Add current price line
-        fig.add_hline(
-            y=current_price,
-            line_dash="dot",
-            line_color="yellow",
-            annotation_text=f"Current: ${current_price:.2f}",
-            annotation_position="right",
-            row=1, col=1
+            for price, _, text, position in levels
+        ]
+        fig.update_layout(
+            shapes=fig.layout.shapes + tuple(shapes),
+            annotations=fig.layout.annotations + tuple(annotations)
         )
 
         # Add volume bars
-        colors = ['#26a69a' if close >= open_price else '#ef5350'
-                  for close, open_price in zip(price_data['close'], price_data['open'])]
+        colors = np.where(
+            price_data['close'].to_numpy() >= price_data['open'].to_numpy(), _BAR_UP, _BAR_DOWN
+        )
 
         fig.add_trace(
             go.Bar(
@@ -559,12 +945,14 @@ class ChartGenerator:
         fig.update_yaxes(title_text="Volume", row=2, col=1)
 
         # Generate filename
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_{zone_type}_with_targets_{timestamp_str}.html"
+        filename = f"{symbol}_{zone_type}_with_targets_{time.time_ns()}.html"
         filepath = self.output_dir / filename
 
         # Save HTML
-        fig.write_html(str(filepath), config={'displayModeBar': True})
+        fig.write_html(
+            str(filepath), include_plotlyjs='cdn', full_html=True,
+            config={'displayModeBar': True}, auto_open=False, validate=False
+        )
 
         logger.info(f"Generated chart with targets: {filepath}")
         return str(filepath)
@@ -606,45 +994,48 @@ class ChartGenerator:
             end_time=current_timestamp
         )
 
-        if not candles or len(candles) < 10:
-            logger.warning(f"Insufficient data for {symbol}: {len(candles)} candles")
+        candle_count = len(candles) if candles else 0
+        if candle_count < 10:
+            logger.warning(f"Insufficient data for {symbol}: {candle_count} candles")
             return None, None
 
-        # Create interactive HTML chart
-        html_path = self._generate_price_action_html(
+        # Build the chart once
+        html_path, fig_dict = self._build_price_action_chart(
             symbol=symbol,
-            timeframe_minutes=timeframe_minutes,
+            timeframe_minutes=candles.timeframe_minutes,
             candles=candles,
             current_timestamp=current_timestamp
         )
 
-        # Generate PNG thumbnail
-        png_path = self._generate_png_thumbnail(html_path)
+        # Disk write and Kaleido render are independent; overlap them
+        html_future = self._write_html_in_background(fig_dict, html_path)
+        png_path = self._generate_png_thumbnail(fig_dict, html_path)
+        html_future.result()
 
         logger.info(f"Generated price action charts: HTML={html_path}, PNG={png_path}")
         return html_path, png_path
 
-    def _generate_price_action_html(
+    def _build_price_action_chart(
         self,
         symbol: str,
         timeframe_minutes: int,
-        candles: List[Dict],
+        candles: Candles,
         current_timestamp: datetime
-    ) -> Path:
+    ) -> Tuple[Path, Dict]:
         """
-        Generate interactive HTML chart for price action (no zones).
+        Build the interactive price action chart (no zones) using Plotly.
+
+        Does not write anything to disk.
 
         Args:
             symbol: Stock symbol
             timeframe_minutes: Chart timeframe in minutes
-            candles: List of candle data
+            candles: Candle columns from _fetch_chart_data
             current_timestamp: Current timestamp
 
         Returns:
-            Path to generated HTML file
+            Tuple of (reserved html_path, serialized figure dict)
         """
-        df = pd.DataFrame(candles)
-
         # Create subplots: price chart + volume
         fig = make_subplots(
             rows=2, cols=1,
@@ -657,29 +1048,33 @@ class ChartGenerator:
             row_heights=[0.7, 0.3]
         )
 
-        # Add candlestick chart
-        fig.add_trace(
-            go.Candlestick(
-                x=df['timestamp'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name='OHLC',
-                increasing_line_color='#4CAF50',
-                decreasing_line_color='#FF5252'
-            ),
-            row=1, col=1
-        )
+        # Add candlestick chart; long windows switch to WebGL line segments,
+        # which stay responsive and serialize as plain numeric arrays
+        if len(candles) > self.WEBGL_CANDLE_THRESHOLD:
+            for trace in _webgl_candle_traces(candles, '#4CAF50', '#FF5252', name='OHLC'):
+                fig.add_trace(trace, row=1, col=1)
+        else:
+            fig.add_trace(
+                go.Candlestick(
+                    x=candles.timestamp,
+                    open=candles.open,
+                    high=candles.high,
+                    low=candles.low,
+                    close=candles.close,
+                    name='OHLC',
+                    increasing_line_color='#4CAF50',
+                    decreasing_line_color='#FF5252'
+                ),
+                row=1, col=1
+            )
 
         # Add volume bars
-        colors = ['#4CAF50' if close >= open else '#FF5252'
-                 for close, open in zip(df['close'], df['open'])]
+        colors = np.where(candles.close >= candles.open, '#4CAF50', '#FF5252')
 
         fig.add_trace(
             go.Bar(
-                x=df['timestamp'],
-                y=df['volume'],
+                x=candles.timestamp,
+                y=candles.volume,
                 name='Volume',
                 marker=dict(
                     color=colors,
@@ -691,8 +1086,8 @@ class ChartGenerator:
         )
 
         # Add current price line
-        if len(df) > 0:
-            current_price = df.iloc[-1]['close']
+        if len(candles) > 0:
+            current_price = candles.last_close
             fig.add_hline(
                 y=current_price,
                 line=dict(color='#2196F3', width=2, dash='dash'),
@@ -729,15 +1124,11 @@ class ChartGenerator:
         fig.update_yaxes(title_text="Volume", row=2, col=1)
 
         # Generate filename
-        timestamp_str = current_timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_price_action_{timeframe_minutes}min_{timestamp_str}.html"
+        filename = f"{symbol}_price_action_{timeframe_minutes}min_{time.time_ns()}.html"
         filepath = self.output_dir / filename
 
-        # Save HTML
-        fig.write_html(str(filepath), config={'displayModeBar': True})
-
-        logger.info(f"Saved HTML chart: {filepath}")
-        return filepath
+        # Serialize once; the HTML and PNG writers share the same dict
+        return filepath, fig.to_dict()
 
 
 if __name__ == '__main__':
@@ -9,22 +9,94 @@ Generates interactive trading dashboards with:
 - TypeScript-based lightweight-charts implementation
 """
 
-import json
+import asyncio
+import gzip
+import multiprocessing
+import re
+import threading
+import weakref
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from database.utils.postgresql_utils import get_connection
+import numpy as np
+import orjson
+from psycopg2.sql import SQL, Identifier
+
+from database.utils.postgresql_utils import PostgreSQLConnectionPool
 from src.storage.azure_blob_manager import AzureBlobManager
 from src.utils.logging_config import setup_logging
 import os
 
+# Fetched JSON text is embedded via orjson.Fragment (orjson >= 3.9); without it
+# every fetch job would fail and dashboards would ship with empty timeframes
+if not hasattr(orjson, 'Fragment'):
+    raise ImportError(
+        "lightweight_dashboard_generator requires orjson >= 3.9 for orjson.Fragment "
+        f"(installed: {getattr(orjson, '__version__', 'unknown')})"
+    )
+
 logger = setup_logging()
 
+# Template placeholders, split out of the template once by _get_template_parts
+_PLACEHOLDER_RE = re.compile(r'\{\{(SYMBOL|MARKET_TYPE|TIMESTAMP|DASHBOARD_DATA)\}\}')
+
+# Blob container dashboards are published to
+DASHBOARD_CONTAINER = 'trading-charts'
+
+# Concurrent blob uploads during batch generation
+UPLOAD_CONCURRENCY = 16
+
+# Symbols fetched together by each bulk timeframe query during batch generation
+SYMBOL_BATCH_SIZE = int(os.environ.get('DASHBOARD_SYMBOL_BATCH', '50'))
+
+# Default worker processes for batch generation. Each worker holds up to
+# DASHBOARD_FETCH_WORKERS connections, so the default stays small rather than
+# scaling with cores; raise DASHBOARD_SYMBOL_WORKERS with the DB pool size.
+SYMBOL_WORKERS_DEFAULT = min(4, os.cpu_count() or 1)
+
+# Batch uploads are stored gzip-encoded; browsers decompress on the fly
+UPLOAD_GZIP_LEVEL = 6
+
+# Candle columns of the SoA payload, in order
+_CANDLE_DTYPE = np.dtype([
+    ('time', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+])
+
+# psycopg2 parameter markers, rewritten to $n when a query is prepared
+_PARAM_RE = re.compile(r'%([s%])')
+
 
 class LightweightDashboardGenerator:
     """Generate self-contained TypeScript dashboards with lightweight-charts"""
 
+    # Timeframes at or below this many minutes stream candles via a named cursor.
+    # There is no binary COPY path for very large windows: lookback_days_map
+    # keeps every window under about 2k candles (crypto 5min over 7 days), so
+    # row decoding never gets near the cost COPY would save.
+    STREAM_CANDLES_MAX_MINUTES = 15
+    CANDLE_ITERSIZE = 10000
+
+    # connection -> {query text: PREPAREd statement name}. A PREPARE lives
+    # as long as its server session, not as long as a generator, so the map
+    # sits on the class where every generator drawing from the pool sees it;
+    # weak keys drop a connection's names once the pool discards it.
+    _prepared_statements: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _prepared_lock = threading.Lock()
+
+    template_path = Path(__file__).parent / 'templates' / 'lightweight_dashboard.html'
+
+    # Template split on its placeholders: literals at even indices, placeholder
+    # names at odd ones (loaded once per process)
+    _template_parts: Optional[Tuple[str, ...]] = None
+
     def __init__(self, market_type: str = 'stocks', skip_upload: bool = False):
         """
         Initialize dashboard generator
@@ -36,19 +108,26 @@ class LightweightDashboardGenerator:
         self.market_type = market_type
         self.schema = market_type  # stocks or crypto schema
         self.skip_upload = skip_upload
+        self.db_pool = PostgreSQLConnectionPool.get_instance()
+
+        # Concurrent timeframe fetches; keep at or below the DB pool size
+        self.fetch_workers = int(os.environ.get('DASHBOARD_FETCH_WORKERS', '8'))
+
+        # Catalog lookups that never change during a run; a failed load is
+        # retried by the next dashboard fetch
+        self._catalog: Optional[Tuple[frozenset, Dict[str, int]]] = None
+        self._get_catalog()
 
         # Initialize Azure Blob Manager with connection string
         if not skip_upload:
             connection_string = os.environ.get('AZURE_STORAGE_CONNECTION_STRING')
             self.blob_manager = AzureBlobManager(
                 connection_string=connection_string,
-                container_name='trading-charts'
+                container_name=DASHBOARD_CONTAINER
             )
         else:
             self.blob_manager = None
 
-        self.template_path = Path(__file__).parent / 'templates' / 'lightweight_dashboard.html'
-
         # Timeframe configurations (in minutes) with lookback days
         if market_type == 'stocks':
             # Stocks: Comprehensive intraday + multi-day timeframes
@@ -130,6 +209,43 @@ class LightweightDashboardGenerator:
                 '93day': 2555,     # 7 years for quarterly
             }
 
+    def _get_catalog(self) -> Tuple[frozenset, Dict[str, int]]:
+        """
+        Load materialized view names and timeframe ids once per generator
+
+        Only a successful load is cached; after a failure the empty fallback is
+        returned and the next call queries the catalog again. Called before a
+        fetch starts its jobs (never from a job, which already holds a pooled
+        connection) and the result is passed down to the query builders.
+
+        Returns:
+            Tuple of (matview names in this schema, timeframe label -> id)
+        """
+        if self._catalog is not None:
+            return self._catalog
+
+        try:
+            with self.db_pool.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT matviewname FROM pg_matviews WHERE schemaname = %s",
+                    (self.schema,)
+                )
+                matviews = frozenset(row[0] for row in cursor.fetchall())
+
+                cursor.execute("SELECT label, id FROM shared.timeframes")
+                timeframe_ids = {row[0]: row[1] for row in cursor.fetchall()}
+
+            logger.info(
+                f"Loaded {len(matviews)} materialized views and {len(timeframe_ids)} timeframes "
+                f"for {self.schema}"
+            )
+            self._catalog = (matviews, timeframe_ids)
+            return self._catalog
+
+        except Exception as e:
+            logger.warning(f"Error loading catalog for {self.schema}, falling back to on-the-fly aggregation: {e}")
+            return frozenset(), {}
+
     def generate_dashboard(
         self,
         symbol: str,
@@ -146,31 +262,15 @@ class LightweightDashboardGenerator:
             Tuple of (dashboard_url, was_uploaded)
         """
         try:
-            logger.info(f"Generating dashboard for {symbol} ({self.market_type})")
-
-            # Fetch all data
-            dashboard_data = self._fetch_dashboard_data(symbol, lookback_days)
-
-            if not dashboard_data:
-                logger.warning(f"No data available for {symbol}")
+            built = self.build_dashboard(symbol, lookback_days)
+            if not built:
                 return None, False
-
-            # Render HTML
-            html_content = self._render_html(dashboard_data)
+            filename, html_content = built
 
             if self.skip_upload:
-                # Save locally
-                output_dir = Path('data/dashboards')
-                output_dir.mkdir(parents=True, exist_ok=True)
-                filename = f"{self.market_type}_{symbol.replace(':', '_').lower()}_dashboard.html"
-                filepath = output_dir / filename
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                logger.info(f"Dashboard saved locally: {filepath}")
-                return str(filepath), True
+                return self._save_local(filename, html_content), True
             else:
                 # Upload to Azure
-                filename = f"{self.market_type}_{symbol.replace(':', '_').lower()}_dashboard.html"
                 url = self.blob_manager.upload_html(html_content, filename)
                 logger.info(f"Dashboard generated: {url}")
                 return url, True
@@ -179,27 +279,82 @@ class LightweightDashboardGenerator:
             logger.error(f"Error generating dashboard for {symbol}: {e}")
             return None, False
 
+    def build_dashboard(self, symbol: str, lookback_days: int = 30) -> Optional[Tuple[str, str]]:
+        """
+        Fetch and render a dashboard without saving or uploading it
+
+        Args:
+            symbol: Stock or crypto symbol
+            lookback_days: Number of days to fetch data
+
+        Returns:
+            Tuple of (filename, html) or None if there is no data
+        """
+        logger.info(f"Generating dashboard for {symbol} ({self.market_type})")
+
+        # Fetch all data
+        dashboard_data = self._fetch_dashboard_data(symbol, lookback_days)
+
+        if not dashboard_data:
+            logger.warning(f"No data available for {symbol}")
+            return None
+
+        # Render HTML
+        return self._dashboard_filename(symbol), self._render_html(dashboard_data)
+
+    def build_dashboards(self, symbols: List[str], lookback_days: int = 30) -> Dict[str, Tuple[str, str]]:
+        """
+        Fetch and render dashboards for a group of symbols with bulk queries
+
+        Args:
+            symbols: Stock or crypto symbols
+            lookback_days: Number of days to fetch data
+
+        Returns:
+            Dictionary mapping symbol to (filename, html); symbols without data are omitted
+        """
+        logger.info(f"Generating dashboards for {len(symbols)} symbols ({self.market_type})")
+        fetched = self._fetch_dashboard_data_bulk(symbols, lookback_days)
+        built = {}
+
+        # Pop each symbol's data as it renders so fetched payloads don't
+        # outlive their page
+        while fetched:
+            symbol, dashboard_data = fetched.popitem()
+            try:
+                built[symbol] = self._dashboard_filename(symbol), self._render_html(dashboard_data)
+            except Exception as e:
+                logger.error(f"Error generating dashboard for {symbol}: {e}")
+
+        return built
+
+    def _dashboard_filename(self, symbol: str) -> str:
+        """Blob/file name of a symbol's dashboard"""
+        return f"{self.market_type}_{symbol.replace(':', '_').lower()}_dashboard.html"
+
+    def _save_local(self, filename: str, html_content: str) -> str:
+        """Save a dashboard under data/dashboards and return its path"""
+        output_dir = Path('data/dashboards')
+        output_dir.mkdir(parents=True, exist_ok=True)
+        filepath = output_dir / filename
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        logger.info(f"Dashboard saved locally: {filepath}")
+        return str(filepath)
+
     def _fetch_dashboard_data(self, symbol: str, lookback_days: int) -> Optional[Dict]:
         """Fetch all dashboard data from database"""
-        conn = None
-        cursor = None
-        
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
             # Get symbol_id
-            cursor.execute(
-                f"SELECT id FROM {self.schema}.symbols WHERE symbol = %s",
-                (symbol,)
-            )
-            result = cursor.fetchone()
+            with self.db_pool.get_cursor() as cursor:
+                cursor.execute(
+                    f"SELECT id FROM {self.schema}.symbols WHERE symbol = %s",
+                    (symbol,)
+                )
+                result = cursor.fetchone()
+
             if not result:
                 logger.warning(f"Symbol {symbol} not found in {self.schema}.symbols")
-                if cursor:
-                    cursor.close()
-                if conn:
-                    conn.close()
                 return None
 
             symbol_id = result[0]
@@ -213,340 +368,730 @@ class LightweightDashboardGenerator:
                 'timeframes': {}
             }
 
-            # Fetch data for each timeframe with appropriate lookback period
-            for tf_name, tf_minutes in self.timeframes.items():
-                logger.info(f"Fetching {tf_name} data for {symbol}")
-
-                try:
-                    # Calculate start date based on timeframe's lookback days
-                    tf_lookback_days = self.lookback_days_map.get(tf_name, lookback_days)
-                    start_date = end_date - timedelta(days=tf_lookback_days)
-
-                    # Fetch candles
-                    candles = self._fetch_candles(cursor, symbol_id, start_date, end_date, tf_minutes)
-
-                    # Fetch zones for this timeframe
-                    zones = self._fetch_zones(cursor, symbol_id, tf_name)
-
-                    # Fetch volume profile
-                    volume_profile = self._fetch_volume_profile(cursor, symbol_id, start_date, end_date)
-
-                    dashboard_data['timeframes'][tf_name] = {
-                        'candles': candles,
-                        'zones': zones,
-                        'volume_profile': volume_profile
-                    }
-
-                except Exception as e:
-                    logger.error(f"Error fetching {tf_name} data: {e}")
-                    # Rollback transaction and close old cursor/connection
-                    if conn:
-                        conn.rollback()
-                    if cursor:
-                        cursor.close()
-                    
-                    # Get new connection for next timeframe
-                    conn = get_connection()
-                    cursor = conn.cursor()
-                    
-                    # Skip this timeframe but continue with others
-                    dashboard_data['timeframes'][tf_name] = {
-                        'candles': [],
-                        'zones': [],
-                        'volume_profile': []
-                    }
-                    continue
-
-            # Close cursor and connection
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+            windows = self._timeframe_windows(lookback_days, end_date)
+            catalog = self._get_catalog()
+            logger.info(f"Fetching {len(windows)} timeframes for {symbol}")
+
+            # Timeframes are independent and latency-bound, and within one
+            # timeframe candles and zones/volume profile read disjoint tables,
+            # so fetch them all concurrently
+            jobs = []
+            for tf_name, tf_minutes, start_date, vp_owner in windows:
+                jobs.append((self._fetch_timeframe_candles, (catalog, symbol_id, tf_minutes, start_date, end_date)))
+                jobs.append((
+                    self._fetch_timeframe_overlays,
+                    (catalog, symbol_id, tf_name, start_date, end_date, vp_owner == tf_name)
+                ))
+            futures = self._run_fetch_jobs(jobs)
+
+            # Keep the configured timeframe order; the template opens the first one.
+            # A failed job leaves its part of the timeframe empty.
+            for (tf_name, _, _, _), candles_future, overlays_future in zip(windows, futures[0::2], futures[1::2]):
+                candles, candle_count = self._job_result(candles_future, ([], 0), f"{tf_name} candles")
+                zones, volume_profile, zone_count, broken_count, vp_count = self._job_result(
+                    overlays_future, ([], [], 0, 0, 0), f"{tf_name} zones and volume profile"
+                )
+                logger.info(
+                    f"Fetched {candle_count} candles, "
+                    f"{zone_count - broken_count} active zones, {broken_count} broken zones and "
+                    f"{vp_count} volume profile nodes for {tf_name}"
+                )
+                dashboard_data['timeframes'][tf_name] = {
+                    'candles': candles,
+                    'zones': zones,
+                    'volume_profile': volume_profile
+                }
+
+            self._share_volume_profiles(dashboard_data['timeframes'], windows)
 
             return dashboard_data
 
         except Exception as e:
             logger.error(f"Error fetching dashboard data: {e}")
-            # Rollback and cleanup on fatal error
-            if conn:
-                conn.rollback()
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
             return None
 
-    def _fetch_candles(
+    def _fetch_dashboard_data_bulk(self, symbols: List[str], lookback_days: int) -> Dict[str, Dict]:
+        """
+        Fetch dashboard data for a group of symbols, one query per timeframe
+
+        Batch generation would otherwise issue the same timeframe query once
+        per symbol; here each timeframe query covers the whole group and the
+        per-symbol documents are split out of its rows.
+
+        Returns:
+            Dictionary mapping symbol to dashboard data (symbols not found are omitted)
+        """
+        try:
+            with self.db_pool.get_cursor() as cursor:
+                cursor.execute(
+                    f"SELECT symbol, id FROM {self.schema}.symbols WHERE symbol = ANY(%s)",
+                    (list(symbols),)
+                )
+                symbol_ids = dict(cursor.fetchall())
+
+            missing = [symbol for symbol in symbols if symbol not in symbol_ids]
+            if missing:
+                logger.warning(f"Symbols not found in {self.schema}.symbols: {', '.join(missing)}")
+            if not symbol_ids:
+                return {}
+
+            ids = list(symbol_ids.values())
+            end_date = datetime.utcnow()
+            windows = self._timeframe_windows(lookback_days, end_date)
+            catalog = self._get_catalog()
+
+            futures = self._run_fetch_jobs([
+                (
+                    self._fetch_timeframe_bulk,
+                    (catalog, ids, tf_name, tf_minutes, start_date, end_date, vp_owner == tf_name)
+                )
+                for tf_name, tf_minutes, start_date, vp_owner in windows
+            ])
+            # A failed timeframe is left empty for every symbol of the group
+            by_timeframe = {
+                tf_name: self._job_result(future, {}, f"{tf_name} data")
+                for (tf_name, _, _, _), future in zip(windows, futures)
+            }
+
+            empty = {'candles': [], 'zones': [], 'volume_profile': []}
+            results = {}
+            for symbol, symbol_id in symbol_ids.items():
+                timeframes = {
+                    tf_name: dict(rows.get(symbol_id, empty))
+                    for tf_name, rows in by_timeframe.items()
+                }
+                self._share_volume_profiles(timeframes, windows)
+                results[symbol] = {
+                    'symbol': symbol,
+                    'market_type': self.market_type.upper(),
+                    'timeframes': timeframes
+                }
+            return results
+
+        except Exception as e:
+            logger.error(f"Error fetching bulk dashboard data: {e}")
+            return {}
+
+    def _timeframe_windows(
+        self,
+        lookback_days: int,
+        end_date: datetime
+    ) -> List[Tuple[str, int, datetime, str]]:
+        """
+        Work out each timeframe's fetch window
+
+        Volume profile depends only on the window, so only the first timeframe
+        with each lookback (its owner) fetches it; see _share_volume_profiles.
+
+        Returns:
+            List of (tf_name, tf_minutes, start_date, volume profile owner) in configured order
+        """
+        windows = []
+        vp_owners = {}
+        for tf_name, tf_minutes in self.timeframes.items():
+            # Calculate start date based on timeframe's lookback days
+            tf_lookback_days = self.lookback_days_map.get(tf_name, lookback_days)
+            start_date = end_date - timedelta(days=tf_lookback_days)
+            vp_owner = vp_owners.setdefault(tf_lookback_days, tf_name)
+            windows.append((tf_name, tf_minutes, start_date, vp_owner))
+        return windows
+
+    @staticmethod
+    def _share_volume_profiles(timeframes: Dict[str, Dict], windows: List[Tuple[str, int, datetime, str]]):
+        """Copy each volume profile owner's nodes onto the timeframes sharing its window"""
+        for tf_name, _, _, vp_owner in windows:
+            if vp_owner != tf_name:
+                timeframes[tf_name]['volume_profile'] = timeframes[vp_owner]['volume_profile']
+
+    def _fetch_timeframe_bulk(
         self,
         cursor,
-        symbol_id: int,
+        catalog: Tuple[frozenset, Dict[str, int]],
+        symbol_ids: List[int],
+        tf_name: str,
+        tf_minutes: int,
         start_date: datetime,
         end_date: datetime,
-        timeframe_minutes: int
-    ) -> List[Dict]:
-        """Fetch candle data from materialized views (preferred) or aggregate on-the-fly"""
-        try:
-            # Map timeframe_minutes to materialized view names
-            matview_map = {
-                2: 'candles_2m',
-                3: 'candles_3m',
-                5: 'candles_5m',
-                6: 'candles_6m',
-                10: 'candles_10m',
-                13: 'candles_13m',
-                15: 'candles_15m',
-                26: 'candles_26m',
-                30: 'candles_30m',
-                39: 'candles_39m',
-                65: 'candles_65m',
-                78: 'candles_78m',
-                130: 'candles_130m',
-                195: 'candles_195m',
-                390: 'candles_390m',
-                1950: 'candles_5d',
-                8580: 'candles_22d',
-                25350: 'candles_65d',
-                # Crypto timeframes
-                60: 'candles_1h',
-                120: 'candles_2h',
-                240: 'candles_4h',
-                480: 'candles_8h',
-                1440: 'candles_1d',
-                10080: 'candles_7d',
-                44640: 'candles_31d',
-                133920: 'candles_93d',
-            }
+        include_volume_profile: bool = True
+    ) -> Dict[int, Dict]:
+        """
+        Fetch one timeframe for many symbols in a single query
 
-            matview_name = matview_map.get(timeframe_minutes)
-            use_matview = False
-
-            if matview_name:
-                # Check if materialized view exists
-                try:
-                    cursor.execute(
-                        """
-                        SELECT EXISTS (
-                            SELECT 1 FROM pg_matviews 
-                            WHERE schemaname = %s AND matviewname = %s
-                        )
-                        """,
-                        (self.schema, matview_name)
-                    )
-                    use_matview = cursor.fetchone()[0]
-                except Exception as check_error:
-                    logger.warning(f"Error checking materialized view {matview_name}: {check_error}")
-                    use_matview = False
-
-            if use_matview:
-                # Use materialized view for optimal performance
-                query = f"""
-                    SELECT
-                        EXTRACT(EPOCH FROM bucket)::bigint as time,
-                        open, high, low, close, volume
-                    FROM {self.schema}.{matview_name}
-                    WHERE symbol_id = %s
-                        AND bucket >= %s
-                        AND bucket <= %s
-                    ORDER BY bucket ASC
-                """
-                cursor.execute(query, (symbol_id, start_date, end_date))
-                logger.info(f"Using materialized view: {self.schema}.{matview_name}")
-            else:
-                # Fallback: aggregate minute data on-the-fly
-                logger.info(f"No materialized view for {timeframe_minutes}min, aggregating on-the-fly")
-                
-                if timeframe_minutes <= 15:
-                    # Small timeframes: filter minute_aggregates
-                    query = f"""
-                        SELECT
-                            EXTRACT(EPOCH FROM timestamp)::bigint as time,
-                            open, high, low, close, volume
-                        FROM {self.schema}.minute_aggregates
-                        WHERE symbol_id = %s
-                            AND timestamp >= %s
-                            AND timestamp <= %s
-                            AND EXTRACT(MINUTE FROM timestamp) %% %s = 0
-                        ORDER BY timestamp ASC
-                    """
-                    cursor.execute(query, (symbol_id, start_date, end_date, timeframe_minutes))
-                else:
-                    # Large timeframes: aggregate using time_bucket
-                    query = f"""
-                        SELECT
-                            EXTRACT(EPOCH FROM time_bucket(%s, timestamp))::bigint as time,
-                            (array_agg(open ORDER BY timestamp))[1] as open,
-                            MAX(high) as high,
-                            MIN(low) as low,
-                            (array_agg(close ORDER BY timestamp DESC))[1] as close,
-                            SUM(volume) as volume
-                        FROM {self.schema}.minute_aggregates
-                        WHERE symbol_id = %s
-                            AND timestamp >= %s
-                            AND timestamp <= %s
-                        GROUP BY time_bucket(%s, timestamp)
-                        ORDER BY time ASC
-                    """
-                    bucket_interval = f'{timeframe_minutes} minutes'
-                    cursor.execute(
-                        query,
-                        (bucket_interval, symbol_id, start_date, end_date, bucket_interval)
-                    )
+        The per-symbol subqueries of the single-symbol fetch are correlated to
+        an unnest of the symbol ids, yielding one row of JSON text per symbol.
+
+        Returns:
+            Dictionary mapping symbol_id to timeframe data
+        """
+        logger.info(f"Fetching {tf_name} data for {len(symbol_ids)} symbols")
+
+        matviews, timeframe_ids = catalog
+        candles_sql, candles_params = self._candles_query(None, start_date, end_date, tf_minutes, matviews)
+        zones_sql, zones_params = self._zones_query(None, tf_name, timeframe_ids)
+        if include_volume_profile:
+            vp_sql, vp_params = self._volume_profile_query(None, start_date, end_date, matviews)
+        else:
+            vp_sql, vp_params = "SELECT '[]'::jsonb", ()
+
+        self._execute_prepared(
+            cursor,
+            f"""
+            SELECT batch.symbol_id, c.doc::text, z.doc::text, v.doc::text
+            FROM unnest(%s::int[]) AS batch(symbol_id)
+            CROSS JOIN LATERAL ({candles_sql}) c(doc)
+            CROSS JOIN LATERAL ({zones_sql}) z(doc)
+            CROSS JOIN LATERAL ({vp_sql}) v(doc)
+            """,
+            (symbol_ids,) + candles_params + zones_params + vp_params
+        )
+        rows = cursor.fetchall()
+
+        logger.info(f"Fetched {tf_name} data for {len(rows)} symbols")
+        return {
+            symbol_id: {
+                'candles': orjson.Fragment(candles_json),
+                'zones': orjson.Fragment(zones_json),
+                'volume_profile': orjson.Fragment(vp_json)
+            }
+            for symbol_id, candles_json, zones_json, vp_json in rows
+        }
 
-            rows = cursor.fetchall()
-            candles = []
+    def _run_fetch_jobs(self, jobs: List[Tuple[Callable, tuple]]) -> List[Future]:
+        """
+        Run fetch jobs on fetch_workers threads sharing one job queue
 
-            for row in rows:
-                candles.append({
-                    'time': row[0],
-                    'open': float(row[1]),
-                    'high': float(row[2]),
-                    'low': float(row[3]),
-                    'close': float(row[4]),
-                    'volume': float(row[5]) if row[5] else 0.0
-                })
+        Each thread checks out a single pooled connection and keeps it for
+        every job it drains, rather than one checkout per job. A failed job is
+        rolled back and retried once on the same connection; only a connection
+        that has actually closed ends its thread (its remaining jobs go to the
+        other threads).
 
-            logger.info(f"Fetched {len(candles)} candles")
-            return candles
+        Args:
+            jobs: (method, args) pairs; each method is called as method(cursor, *args)
 
+        Returns:
+            One future per job, in order, all resolved
+        """
+        futures = [Future() for _ in jobs]
+        pending = queue.SimpleQueue()
+        for item in zip(futures, jobs):
+            pending.put(item)
+
+        def drain():
+            # Runs detached from any future, so whatever ends the thread early
+            # (a failed checkout or a dropped connection) is only seen here
+            try:
+                with self.db_pool.get_connection() as conn:
+                    while True:
+                        try:
+                            future, (job, args) = pending.get_nowait()
+                        except queue.Empty:
+                            return
+                        try:
+                            future.set_result(self._run_fetch_job(conn, job, args))
+                        except Exception as e:
+                            future.set_exception(e)
+                            if conn.closed:
+                                raise
+            except Exception as e:
+                logger.error(f"Fetch worker stopped without its database connection: {e}", exc_info=True)
+
+        workers = max(1, min(self.fetch_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(workers):
+                executor.submit(drain)
+
+        # Jobs still queued when every thread lost its connection
+        for future in futures:
+            if not future.done():
+                future.set_exception(ConnectionError("No database connection left to run fetch job"))
+        return futures
+
+    @staticmethod
+    def _run_fetch_job(conn, job: Callable, args: tuple):
+        """Run one fetch job on a worker's connection, retrying once after a rollback"""
+        for attempt in range(2):
+            try:
+                with conn.cursor() as cursor:
+                    return job(cursor, *args)
+            except Exception as e:
+                if conn.closed or attempt:
+                    raise
+                logger.warning(f"{job.__name__} failed, retrying on the same connection: {e}")
+            finally:
+                # End the read transaction (and clear any aborted state)
+                # before the next job
+                if not conn.closed:
+                    conn.rollback()
+
+    @staticmethod
+    def _job_result(future: Future, default, what: str):
+        """Result of a fetch job, or default (logged) if it failed"""
+        try:
+            return future.result()
         except Exception as e:
-            logger.error(f"Error fetching candles: {e}", exc_info=True)
-            return []
+            logger.error(f"Error fetching {what}: {e}", exc_info=e)
+            return default
 
-    def _fetch_zones(self, cursor, symbol_id: int, timeframe: str) -> List[Dict]:
-        """Fetch zones for specific timeframe with breakout tracking"""
-        try:
-            # Get timeframe_id
+    def _fetch_timeframe_candles(
+        self,
+        cursor,
+        catalog: Tuple[frozenset, Dict[str, int]],
+        symbol_id: int,
+        tf_minutes: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[object, int]:
+        """
+        Fetch one timeframe's candles
+
+        Candles are aggregated server-side into JSONB and come back as JSON
+        text that is embedded in the page as-is (orjson.Fragment) rather than
+        parsed into Python objects and re-serialized. Short timeframes stream
+        their candles into NumPy columns instead.
+
+        Returns:
+            Tuple of (candles payload, candle count)
+        """
+        matviews = catalog[0]
+        if tf_minutes <= self.STREAM_CANDLES_MAX_MINUTES:
+            return self._stream_candles(cursor, symbol_id, start_date, end_date, tf_minutes, matviews)
+
+        candles_sql, candles_params = self._candles_query(symbol_id, start_date, end_date, tf_minutes, matviews)
+        self._execute_prepared(
+            cursor,
+            f"""
+            SELECT c.doc::text, COALESCE(jsonb_array_length(c.doc->'time'), 0)
+            FROM ({candles_sql}) c(doc)
+            """,
+            candles_params
+        )
+        candles_json, candle_count = cursor.fetchone()
+        return orjson.Fragment(candles_json), candle_count
+
+    def _fetch_timeframe_overlays(
+        self,
+        cursor,
+        catalog: Tuple[frozenset, Dict[str, int]],
+        symbol_id: int,
+        tf_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        include_volume_profile: bool = True
+    ) -> Tuple[object, object, int, int, int]:
+        """
+        Fetch one timeframe's zones and volume profile
+
+        Both are small, so they share one round trip, returned as JSON text
+        alongside the counts used for logging. With include_volume_profile
+        False the volume profile comes back empty, for the caller to share from
+        another timeframe with the same window.
+
+        Returns:
+            Tuple of (zones, volume profile, zone count, broken zone count, node count)
+        """
+        matviews, timeframe_ids = catalog
+        zones_sql, zones_params = self._zones_query(symbol_id, tf_name, timeframe_ids)
+        if include_volume_profile:
+            vp_sql, vp_params = self._volume_profile_query(symbol_id, start_date, end_date, matviews)
+        else:
+            vp_sql, vp_params = "SELECT '[]'::jsonb", ()
+
+        self._execute_prepared(
+            cursor,
+            f"""
+            SELECT
+                z.doc::text, v.doc::text,
+                jsonb_array_length(z.doc),
+                (SELECT count(*) FROM jsonb_array_elements(z.doc) e
+                 WHERE (e->>'is_broken')::boolean),
+                jsonb_array_length(v.doc)
+            FROM ({zones_sql}) z(doc), ({vp_sql}) v(doc)
+            """,
+            zones_params + vp_params
+        )
+        zones_json, vp_json, zone_count, broken_count, vp_count = cursor.fetchone()
+        return orjson.Fragment(zones_json), orjson.Fragment(vp_json), zone_count, broken_count, vp_count
+
+    def _execute_prepared(self, cursor, query: str, params: tuple):
+        """
+        Execute a query through a prepared statement on the cursor's connection
+
+        Only a handful of distinct query texts exist (one per candle source,
+        market and zone availability) while every symbol re-runs them, so each
+        is parsed and planned once per pooled connection and then EXECUTEd.
+
+        Args:
+            cursor: Cursor on a pooled connection
+            query: SQL with psycopg2 %s parameters
+            params: Query parameters
+        """
+        conn = cursor.connection
+
+        with self._prepared_lock:
+            prepared = self._prepared_statements.setdefault(conn, {})
+            statement = prepared.get(query)
+
+        if statement is None:
+            statement = f"dashboard_{self.schema}_{len(prepared) + 1}"
+            positions = iter(range(1, len(params) + 1))
+            body = _PARAM_RE.sub(
+                lambda match: f"${next(positions)}" if match.group(1) == 's' else '%',
+                query
+            )
+            cursor.execute(SQL("PREPARE {} AS ").format(Identifier(statement)) + SQL(body))
+            with self._prepared_lock:
+                prepared[query] = statement
+
+        if params:
             cursor.execute(
-                "SELECT id FROM shared.timeframes WHERE label = %s",
-                (timeframe,)
+                SQL("EXECUTE {} ({})").format(
+                    Identifier(statement),
+                    SQL(', ').join(SQL('%s') for _ in params)
+                ),
+                params
             )
-            result = cursor.fetchone()
-            if not result:
-                logger.warning(f"Timeframe {timeframe} not found in shared.timeframes")
-                return []
+        else:
+            cursor.execute(SQL("EXECUTE {}").format(Identifier(statement)))
+
+    @staticmethod
+    def _symbol_filter(symbol_id: Optional[int]) -> Tuple[str, tuple]:
+        """
+        SQL and params matching one symbol
+
+        A symbol_id of None matches batch.symbol_id instead, for subqueries
+        correlated to the symbol list of a bulk query (_fetch_timeframe_bulk).
+        """
+        if symbol_id is None:
+            return 'batch.symbol_id', ()
+        return '%s', (symbol_id,)
+
+    def _candle_rows_query(
+        self,
+        symbol_id: Optional[int],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_minutes: int,
+        matviews: frozenset
+    ) -> Tuple[str, tuple]:
+        """
+        Build the candle row query from materialized views (preferred) or on-the-fly aggregation
+
+        Returns:
+            Tuple of (SQL yielding time, open, high, low, close, volume rows, params)
+        """
+        # Map timeframe_minutes to materialized view names
+        matview_map = {
+            2: 'candles_2m',
+            3: 'candles_3m',
+            5: 'candles_5m',
+            6: 'candles_6m',
+            10: 'candles_10m',
+            13: 'candles_13m',
+            15: 'candles_15m',
+            26: 'candles_26m',
+            30: 'candles_30m',
+            39: 'candles_39m',
+            65: 'candles_65m',
+            78: 'candles_78m',
+            130: 'candles_130m',
+            195: 'candles_195m',
+            390: 'candles_390m',
+            1950: 'candles_5d',
+            8580: 'candles_22d',
+            25350: 'candles_65d',
+            # Crypto timeframes
+            60: 'candles_1h',
+            120: 'candles_2h',
+            240: 'candles_4h',
+            480: 'candles_8h',
+            1440: 'candles_1d',
+            10080: 'candles_7d',
+            44640: 'candles_31d',
+            133920: 'candles_93d',
+        }
+
+        matview_name = matview_map.get(timeframe_minutes)
+        use_matview = matview_name in matviews
+        symbol_sql, symbol_params = self._symbol_filter(symbol_id)
+
+        # Epoch seconds come from date_part, which yields float8 (one cheap
+        # cast to bigint) where EXTRACT(EPOCH ...) builds a numeric per row
+
+        if use_matview:
+            # Use materialized view for optimal performance
+            logger.info(f"Using materialized view: {self.schema}.{matview_name}")
+            rows_sql = f"""
+                SELECT
+                    date_part('epoch', bucket)::bigint as time,
+                    open, high, low, close, volume
+                FROM {self.schema}.{matview_name}
+                WHERE symbol_id = {symbol_sql}
+                    AND bucket >= %s
+                    AND bucket <= %s
+            """
+            params = (*symbol_params, start_date, end_date)
+        else:
+            # Fallback: aggregate minute data on-the-fly
+            logger.info(f"No materialized view for {timeframe_minutes}min, aggregating on-the-fly")
+
+            # Bucket every timeframe the same way: a plain range scan on
+            # (symbol_id, timestamp), with TimescaleDB first/last for open/close
+            rows_sql = f"""
+                SELECT
+                    date_part('epoch', time_bucket(%s::interval, timestamp))::bigint as time,
+                    first(open, timestamp) as open,
+                    MAX(high) as high,
+                    MIN(low) as low,
+                    last(close, timestamp) as close,
+                    SUM(volume) as volume
+                FROM {self.schema}.minute_aggregates
+                WHERE symbol_id = {symbol_sql}
+                    AND timestamp >= %s
+                    AND timestamp <= %s
+                GROUP BY 1
+            """
+            params = (f'{timeframe_minutes} minutes', *symbol_params, start_date, end_date)
+
+        return rows_sql, params
+
+    def _candles_query(
+        self,
+        symbol_id: Optional[int],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_minutes: int,
+        matviews: frozenset
+    ) -> Tuple[str, tuple]:
+        """
+        Build the candle subquery aggregated into column-oriented JSONB
+
+        Candles are shipped as parallel arrays ({time: [...], open: [...], ...})
+        rather than one object per candle, so keys are not repeated per row; the
+        template expands them for lightweight-charts. Prices and volume are cast
+        to float8 so the JSON carries plain doubles rather than numeric text.
 
-            timeframe_id = result[0]
-            logger.info(f"Found timeframe_id={timeframe_id} for label '{timeframe}'")
+        Returns:
+            Tuple of (SQL yielding one JSONB object of candle columns, params)
+        """
+        rows_sql, params = self._candle_rows_query(symbol_id, start_date, end_date, timeframe_minutes, matviews)
+        sql = f"""
+            SELECT jsonb_build_object(
+                'time', COALESCE(jsonb_agg(c.time ORDER BY c.time), '[]'::jsonb),
+                'open', COALESCE(jsonb_agg(c.open::float8 ORDER BY c.time), '[]'::jsonb),
+                'high', COALESCE(jsonb_agg(c.high::float8 ORDER BY c.time), '[]'::jsonb),
+                'low', COALESCE(jsonb_agg(c.low::float8 ORDER BY c.time), '[]'::jsonb),
+                'close', COALESCE(jsonb_agg(c.close::float8 ORDER BY c.time), '[]'::jsonb),
+                'volume', COALESCE(jsonb_agg(COALESCE(c.volume, 0)::float8 ORDER BY c.time), '[]'::jsonb)
+            )
+            FROM ({rows_sql}) c
+        """
+        return sql, params
 
-            # Fetch zones with breakout information
-            query = f"""
+    def _stream_candles(
+        self,
+        cursor,
+        symbol_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_minutes: int,
+        matviews: frozenset
+    ) -> Tuple[Dict[str, np.ndarray], int]:
+        """
+        Stream candles through a server-side cursor
+
+        Used for short timeframes, the largest result sets. Each batch of rows
+        is packed straight into a NumPy structured array, and the columns are
+        handed to orjson as contiguous arrays.
+
+        Returns:
+            Tuple of (candle columns keyed like _CANDLE_DTYPE, candle count)
+        """
+        rows_sql, params = self._candle_rows_query(symbol_id, start_date, end_date, timeframe_minutes, matviews)
+
+        # Named cursors live on the connection, inside the job's transaction
+        with cursor.connection.cursor(name=f'cur_{symbol_id}_{timeframe_minutes}') as stream:
+            stream.itersize = self.CANDLE_ITERSIZE
+            stream.execute(
+                f"""
+                SELECT
+                    c.time,
+                    c.open::float8, c.high::float8, c.low::float8, c.close::float8,
+                    COALESCE(c.volume, 0)::float8
+                FROM ({rows_sql}) c
+                ORDER BY c.time ASC
+                """,
+                params
+            )
+            chunks = []
+            while True:
+                rows = stream.fetchmany(self.CANDLE_ITERSIZE)
+                if not rows:
+                    break
+                chunks.append(np.array(rows, dtype=_CANDLE_DTYPE))
+
+        candles = np.concatenate(chunks) if chunks else np.empty(0, dtype=_CANDLE_DTYPE)
+        # The batches were copied into one array; free them before the columns
+        del chunks
+
+        # orjson only serializes C-contiguous arrays; structured fields are strided.
+        # Only the columns (~50 bytes per candle) outlive this call.
+        columns = {name: np.ascontiguousarray(candles[name]) for name in _CANDLE_DTYPE.names}
+        return columns, len(candles)
+
+    def _zones_query(
+        self,
+        symbol_id: Optional[int],
+        timeframe: str,
+        timeframe_ids: Dict[str, int]
+    ) -> Tuple[str, tuple]:
+        """
+        Build the zone subquery for a timeframe with breakout tracking
+
+        Returns:
+            Tuple of (SQL yielding one JSONB array of zones, params)
+        """
+        timeframe_id = timeframe_ids.get(timeframe)
+        if timeframe_id is None:
+            logger.warning(f"Timeframe {timeframe} not found in shared.timeframes")
+            return "SELECT '[]'::jsonb", ()
+
+        symbol_sql, symbol_params = self._symbol_filter(symbol_id)
+        sql = f"""
+            SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                'zone_id', z.zone_id,
+                'zone_type', z.zone_type,
+                'bottom_price', z.bottom_price::float8,
+                'top_price', z.top_price::float8,
+                'start_time', z.start_time,
+                'end_time', z.end_time,
+                'zone_score', z.zone_score::float8,
+                'is_broken', z.is_broken,
+                'exit_price', NULL,  -- Not tracked in database
+                'exit_time', NULL,   -- Not tracked in database
+                'timeframe', %s::text
+            ) ORDER BY z.zone_score DESC, z.start_time DESC), '[]'::jsonb)
+            FROM (
                 SELECT
                     zone_id,
                     zone_type,
                     bottom_price,
                     top_price,
-                    EXTRACT(EPOCH FROM start_time)::bigint as start_time,
-                    EXTRACT(EPOCH FROM end_time)::bigint as end_time,
+                    date_part('epoch', start_time)::bigint as start_time,
+                    date_part('epoch', end_time)::bigint as end_time,
                     COALESCE(zone_score, 0.0) as zone_score,
                     is_broken
                 FROM {self.schema}.zones
-                WHERE symbol_id = %s
+                WHERE symbol_id = {symbol_sql}
                     AND timeframe_id = %s
                 ORDER BY zone_score DESC, start_time DESC
                 LIMIT 30
-            """
-            cursor.execute(query, (symbol_id, timeframe_id))
-            rows = cursor.fetchall()
-
-            zones = []
-            for row in rows:
-                zone_data = {
-                    'zone_id': row[0],
-                    'zone_type': row[1],
-                    'bottom_price': float(row[2]),
-                    'top_price': float(row[3]),
-                    'start_time': row[4],
-                    'end_time': row[5],
-                    'zone_score': float(row[6]),
-                    'is_broken': row[7],
-                    'exit_price': None,  # Not tracked in database
-                    'exit_time': None,   # Not tracked in database
-                    'timeframe': timeframe
-                }
-                zones.append(zone_data)
-
-            active_zones = [z for z in zones if not z['is_broken']]
-            broken_zones = [z for z in zones if z['is_broken']]
-            
-            logger.info(f"Fetched {len(active_zones)} active zones and {len(broken_zones)} broken zones for {timeframe}")
-            return zones
-
-        except Exception as e:
-            logger.error(f"Error fetching zones: {e}", exc_info=True)
-            return []
+            ) z
+        """
+        return sql, (timeframe, *symbol_params, timeframe_id)
 
-    def _fetch_volume_profile(
+    def _volume_profile_query(
         self,
-        cursor,
-        symbol_id: int,
+        symbol_id: Optional[int],
         start_date: datetime,
-        end_date: datetime
-    ) -> List[Dict]:
-        """Fetch volume profile data"""
-        try:
-            # Different schemas have different column names
-            if self.schema == 'stocks':
-                # Stocks schema uses period_start (timestamp)
-                date_column = 'period_start'
-                params = (symbol_id, start_date, end_date)
-            else:
-                # Crypto schema uses date (date type)
-                date_column = 'date'
-                params = (symbol_id, start_date.date(), end_date.date())
+        end_date: datetime,
+        matviews: frozenset
+    ) -> Tuple[str, tuple]:
+        """
+        Build the volume profile subquery
+
+        Reads the precomputed top nodes from the volume_profile_top50 summary
+        view when it exists and covers this lookback; otherwise ranks the
+        window's price levels on the fly.
 
-            query = f"""
+        Returns:
+            Tuple of (SQL yielding one JSONB array of nodes, params)
+        """
+        symbol_sql, symbol_params = self._symbol_filter(symbol_id)
+
+        lookback_days = (end_date - start_date).days
+        if (
+            'volume_profile_top50' in matviews
+            and lookback_days in self.lookback_days_map.values()
+        ):
+            sql = f"""
+                SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                    'price', v.price::float8,
+                    'dollar_volume', COALESCE(v.total_volume, 0)::float8,
+                    'is_hvn', COALESCE(v.is_hvn, false),
+                    'is_lvn', COALESCE(v.is_lvn, false)
+                ) ORDER BY v.rank), '[]'::jsonb)
+                FROM {self.schema}.volume_profile_top50 v
+                WHERE v.symbol_id = {symbol_sql}
+                    AND v.lookback_days = %s
+            """
+            return sql, (*symbol_params, lookback_days)
+
+        # Different schemas have different column names
+        if self.schema == 'stocks':
+            # Stocks schema uses period_start (timestamp)
+            date_column = 'period_start'
+            params = (*symbol_params, start_date, end_date)
+        else:
+            # Crypto schema uses date (date type)
+            date_column = 'date'
+            params = (*symbol_params, start_date.date(), end_date.date())
+
+        sql = f"""
+            SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                'price', v.price::float8,
+                'dollar_volume', COALESCE(v.total_volume, 0)::float8,
+                'is_hvn', COALESCE(v.is_hvn, false),
+                'is_lvn', COALESCE(v.is_lvn, false)
+            ) ORDER BY v.total_volume DESC), '[]'::jsonb)
+            FROM (
                 SELECT
                     price_level as price,
                     SUM(volume) as total_volume,
                     BOOL_OR(node_type = 'HVN') as is_hvn,
                     BOOL_OR(node_type = 'LVN') as is_lvn
                 FROM {self.schema}.volume_profile
-                WHERE symbol_id = %s
+                WHERE symbol_id = {symbol_sql}
                     AND {date_column} >= %s
                     AND {date_column} <= %s
                 GROUP BY price_level
                 ORDER BY total_volume DESC
                 LIMIT 50
-            """
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            nodes = []
-            for row in rows:
-                nodes.append({
-                    'price': float(row[0]),
-                    'dollar_volume': float(row[1]) if row[1] else 0.0,
-                    'is_hvn': bool(row[2]) if row[2] is not None else False,
-                    'is_lvn': bool(row[3]) if row[3] is not None else False
-                })
-
-            logger.info(f"Fetched {len(nodes)} volume profile nodes")
-            return nodes
+            ) v
+        """
+        return sql, params
 
-        except Exception as e:
-            logger.error(f"Error fetching volume profile: {e}", exc_info=True)
-            return []
+    @classmethod
+    def _get_template_parts(cls) -> Tuple[str, ...]:
+        """Read the template and split it on its placeholders, once per process"""
+        if cls._template_parts is None:
+            template = cls.template_path.read_text(encoding='utf-8')
+            cls._template_parts = tuple(_PLACEHOLDER_RE.split(template))
+        return cls._template_parts
 
     def _render_html(self, dashboard_data: Dict) -> str:
         """Render HTML from template with dashboard data"""
         try:
-            # Read template
-            with open(self.template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
+            parts = self._get_template_parts()
 
-            # Prepare data for JavaScript (convert to JSON)
-            dashboard_json = json.dumps(dashboard_data, indent=2)
+            # Prepare data for JavaScript (compact JSON, no indent); streamed
+            # candle columns are NumPy arrays encoded straight from their buffers
+            dashboard_json = orjson.dumps(dashboard_data, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
 
             # Get current timestamp
             timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
 
-            # Replace placeholders
-            html = template.replace('{{SYMBOL}}', dashboard_data['symbol'])
-            html = html.replace('{{MARKET_TYPE}}', dashboard_data['market_type'])
-            html = html.replace('{{TIMESTAMP}}', timestamp)
-            html = html.replace('{{DASHBOARD_DATA}}', dashboard_json)
-
-            return html
+            # Interleave the template literals with the placeholder values
+            values = {
+                'SYMBOL': dashboard_data['symbol'],
+                'MARKET_TYPE': dashboard_data['market_type'],
+                'TIMESTAMP': timestamp,
+                'DASHBOARD_DATA': dashboard_json,
+            }
+            return ''.join([
+                values[part] if idx % 2 else part
+                for idx, part in enumerate(parts)
+            ])
 
         except Exception as e:
             logger.error(f"Error rendering HTML: {e}")
@@ -566,10 +1111,143 @@ def generate_crypto_dashboard(symbol: str, lookback_days: int = 30, skip_upload:
     return generator.generate_dashboard(symbol, lookback_days)
 
 
+# Generator owned by a batch worker process (set by _init_batch_worker)
+_batch_generator: Optional[LightweightDashboardGenerator] = None
+
+
+def _init_batch_worker(market_type: str, skip_upload: bool) -> None:
+    """Give a batch worker process its own connection pool and generator"""
+    global _batch_generator
+    PostgreSQLConnectionPool.get_instance().initialize()
+    _batch_generator = LightweightDashboardGenerator(market_type=market_type, skip_upload=skip_upload)
+
+
+def _generate_batch_dashboards(symbols: List[str], lookback_days: int) -> List[Optional[str]]:
+    """Generate and save a group of dashboards inside a batch worker process"""
+    try:
+        built = _batch_generator.build_dashboards(symbols, lookback_days)
+    except Exception as e:
+        logger.error(f"ERROR: {symbols[0]}..{symbols[-1]} - {e}")
+        return [None] * len(symbols)
+
+    paths = []
+    for symbol in symbols:
+        if symbol in built:
+            paths.append(_batch_generator._save_local(*built[symbol]))
+        else:
+            paths.append(None)
+    return paths
+
+
+def _build_batch_dashboards(symbols: List[str], lookback_days: int) -> List[Optional[Tuple[str, bytes]]]:
+    """Render and gzip a group of dashboards inside a batch worker process for the parent to upload"""
+    try:
+        built = _batch_generator.build_dashboards(symbols, lookback_days)
+    except Exception as e:
+        logger.error(f"ERROR: {symbols[0]}..{symbols[-1]} - {e}")
+        return [None] * len(symbols)
+
+    pages = []
+    for symbol in symbols:
+        if symbol in built:
+            # Keep only the compressed page once it's gzipped
+            filename, html_content = built.pop(symbol)
+            pages.append((filename, gzip.compress(html_content.encode('utf-8'), compresslevel=UPLOAD_GZIP_LEVEL)))
+        else:
+            pages.append(None)
+    return pages
+
+
+def _log_group_failure(group: List[str], error: Exception) -> None:
+    """Log a symbol group whose worker process failed"""
+    logger.error(f"ERROR: {group[0]}..{group[-1]} - worker failed: {error}")
+
+
+def _submit_group(executor: ProcessPoolExecutor, fn: Callable, group: List[str], lookback_days: int) -> Future:
+    """Submit a symbol group, turning a refused submit (broken pool) into a failed future"""
+    try:
+        return executor.submit(fn, group, lookback_days)
+    except Exception as e:
+        future = Future()
+        future.set_exception(e)
+        return future
+
+
+def _group_result(group: List[str], future: Future) -> List:
+    """Result of a batch worker future, or one None per symbol if the worker failed"""
+    try:
+        return future.result()
+    except Exception as e:
+        _log_group_failure(group, e)
+        return [None] * len(group)
+
+
+async def _upload_batch_dashboards(
+    executor: ProcessPoolExecutor,
+    groups: List[List[str]],
+    lookback_days: int
+) -> List[Optional[str]]:
+    """
+    Render symbol groups on the worker processes and upload them as they finish
+
+    Uploads share one async container client and are bounded by a semaphore,
+    so upload wall time overlaps rendering instead of adding a blocking PUT
+    per symbol. Pages arrive gzipped from the workers and are stored with
+    Content-Encoding: gzip.
+
+    Returns:
+        Dashboard URL (or None) for each symbol of each group, in order
+    """
+    from azure.storage.blob import ContentSettings
+    from azure.storage.blob.aio import ContainerClient
+
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    content_settings = ContentSettings(content_type='text/html; charset=utf-8', content_encoding='gzip')
+    connection_string = os.environ.get('AZURE_STORAGE_CONNECTION_STRING')
+
+    async with ContainerClient.from_connection_string(connection_string, DASHBOARD_CONTAINER) as container:
+
+        async def upload(symbol: str, page: Optional[Tuple[str, bytes]]) -> Optional[str]:
+            if not page:
+                return None
+
+            filename, body = page
+            blob = container.get_blob_client(filename)
+            try:
+                async with semaphore:
+                    await blob.upload_blob(
+                        body,
+                        overwrite=True,
+                        content_settings=content_settings
+                    )
+            except Exception as e:
+                logger.error(f"ERROR: {symbol} - upload failed: {e}")
+                return None
+            return blob.url
+
+        async def build_and_upload(group: List[str]) -> List[Optional[str]]:
+            try:
+                pages = await asyncio.wrap_future(executor.submit(_build_batch_dashboards, group, lookback_days))
+            except Exception as e:
+                # e.g. BrokenProcessPool after a worker was killed; skip the group, keep the batch
+                _log_group_failure(group, e)
+                return [None] * len(group)
+            return await asyncio.gather(*(upload(symbol, page) for symbol, page in zip(group, pages)))
+
+        urls = await asyncio.gather(*(build_and_upload(group) for group in groups))
+        return [url for group_urls in urls for url in group_urls]
+
+
 def generate_all_stock_dashboards(lookback_days: int = 90, skip_upload: bool = False) -> Dict[str, str]:
     """
     Generate dashboards for all stocks in the database
 
+    Symbols are fetched in groups of SYMBOL_BATCH_SIZE with one bulk query
+    per timeframe, and the groups are spread over a pool of worker
+    processes (DASHBOARD_SYMBOL_WORKERS, default SYMBOL_WORKERS_DEFAULT). Workers are
+    spawned rather than forked so none inherit the parent's pooled sockets.
+    When uploading, workers only render and the parent uploads concurrently.
+
     Args:
         lookback_days: Number of days of historical data to include
         skip_upload: If True, save locally instead of uploading to Azure
@@ -603,23 +1281,34 @@ def generate_all_stock_dashboards(lookback_days: int = 90, skip_upload: bool = F
         cursor = None
         conn = None
 
-        # Generate dashboard for each symbol
-        generator = LightweightDashboardGenerator(market_type='stocks', skip_upload=skip_upload)
-
-        for idx, symbol in enumerate(symbols, 1):
-            try:
-                logger.info(f"[{idx}/{len(symbols)}] Generating dashboard for {symbol}...")
-                url, uploaded = generator.generate_dashboard(symbol, lookback_days)
+        # Generate dashboards across worker processes
+        groups = [symbols[i:i + SYMBOL_BATCH_SIZE] for i in range(0, len(symbols), SYMBOL_BATCH_SIZE)]
+        max_workers = int(os.environ.get('DASHBOARD_SYMBOL_WORKERS', str(SYMBOL_WORKERS_DEFAULT)))
+        max_workers = max(1, min(max_workers, len(groups)))
+        logger.info(f"Generating dashboards with {max_workers} worker processes")
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_batch_worker,
+            initargs=('stocks', True)
+        ) as executor:
+            if skip_upload:
+                futures = [_submit_group(executor, _generate_batch_dashboards, group, lookback_days) for group in groups]
+                urls = (
+                    path
+                    for group, future in zip(groups, futures)
+                    for path in _group_result(group, future)
+                )
+            else:
+                urls = asyncio.run(_upload_batch_dashboards(executor, groups, lookback_days))
 
+            for idx, (symbol, url) in enumerate(zip(symbols, urls), 1):
                 if url:
                     results[symbol] = url
-                    logger.info(f"SUCCESS: {symbol} -> {url}")
+                    logger.info(f"[{idx}/{len(symbols)}] SUCCESS: {symbol} -> {url}")
                 else:
-                    logger.warning(f"SKIP: {symbol} - No data or generation failed")
-
-            except Exception as e:
-                logger.error(f"ERROR: {symbol} - {e}")
-                continue
+                    logger.warning(f"[{idx}/{len(symbols)}] SKIP: {symbol} - No data or generation failed")
 
         logger.info(f"Batch generation complete: {len(results)}/{len(symbols)} dashboards generated")
         return results
@@ -638,7 +1327,6 @@ if __name__ == '__main__':
     """Command line dashboard generation"""
     import sys
     import argparse
-    from database.utils.postgresql_utils import PostgreSQLConnectionPool
 
     # Initialize connection pool
     pool = PostgreSQLConnectionPool.get_instance()